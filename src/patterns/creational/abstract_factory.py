@@ -12,10 +12,13 @@ Usage:
 -------------------------------------------------
 """
 
+import io
+import importlib
 from abc import ABC, abstractmethod
 
 
 class Button(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def render(self) -> str:
@@ -23,6 +26,7 @@ class Button(ABC):
 
 
 class Checkbox(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def render(self) -> str:
@@ -30,24 +34,28 @@ class Checkbox(ABC):
 
 
 class WindowsButton(Button):
+    __slots__ = ()
 
     def render(self) -> str:
         return "Rendering Windows Button"
 
 
 class WindowsCheckbox(Checkbox):
+    __slots__ = ()
 
     def render(self) -> str:
         return "Rendering Windows Checkbox"
 
 
 class MacOSButton(Button):
+    __slots__ = ()
 
     def render(self) -> str:
         return "Rendering MacOS Button"
 
 
 class MacOSCheckbox(Checkbox):
+    __slots__ = ()
 
     def render(self) -> str:
         return "Rendering MacOS Checkbox"
@@ -63,6 +71,40 @@ class GUIFactory(ABC):
     def create_checkbox(self) -> Checkbox:
         pass
 
+    def render(self, kind: str) -> str:
+        create = getattr(self, f"create_{kind}", None)
+        if create is None:
+            raise ValueError(f"Unknown widget kind: {kind}")
+        return create().render()
+
+    def render_layout(self, layout, stream=None, indent: str = "  "):
+        """
+        Render a layout (a widget kind, or a list/tuple of layouts nested to
+        any depth) into `stream`, one line per widget, indented by nesting
+        depth. Each distinct (kind, depth) line is rendered once and then
+        written straight to the stream. Returns the stream (a new StringIO
+        when none is given).
+        """
+        if stream is None:
+            stream = io.StringIO()
+        write = stream.write
+        lines = {}
+        stack = [iter((layout, ))]
+        while stack:
+            for spec in stack[-1]:
+                if isinstance(spec, (list, tuple)):
+                    stack.append(iter(spec))
+                    break
+                depth = len(stack) - 2
+                line = lines.get((spec, depth))
+                if line is None:
+                    line = lines[(spec, depth)] = (
+                        f"{indent * max(depth, 0)}{self.render(spec)}\n")
+                write(line)
+            else:
+                stack.pop()
+        return stream
+
 
 class WindowsFactory(GUIFactory):
 
@@ -82,6 +124,68 @@ class MacOSFactory(GUIFactory):
         return MacOSCheckbox()
 
 
+class CachingGUIFactory(GUIFactory):
+    """
+    Wraps a factory whose products are stateless: every `create_*` call hands
+    out the same shared instance, and `render(kind)` memoizes the rendered
+    output per (family, product) pair.
+    """
+
+    def __init__(self, factory: GUIFactory):
+        self._factory = factory
+        self._products = {}
+        self._renders = {}
+
+    def create_button(self) -> Button:
+        return self._product("button")
+
+    def create_checkbox(self) -> Checkbox:
+        return self._product("checkbox")
+
+    def render(self, kind: str) -> str:
+        output = self._renders.get(kind)
+        if output is None:
+            output = self._renders[kind] = self._product(kind).render()
+        return output
+
+    def _product(self, kind: str):
+        product = self._products.get(kind)
+        if product is None:
+            create = getattr(self._factory, f"create_{kind}", None)
+            if create is None:
+                raise ValueError(f"Unknown widget kind: {kind}")
+            product = self._products[kind] = create()
+        return product
+
+
+_gui_families = {
+    "windows": f"{__name__}:WindowsFactory",
+    "macos": f"{__name__}:MacOSFactory",
+}
+_gui_factories = {}
+
+
+def register_gui_family(family: str, target: str):
+    """Register a factory family as "module:attr"; it is imported on first use."""
+    _gui_families[family] = target
+    _gui_factories.pop((family, True), None)
+    _gui_factories.pop((family, False), None)
+
+
+def get_gui_factory(family: str, cached: bool = True) -> GUIFactory:
+    factory = _gui_factories.get((family, cached))
+    if factory is None:
+        target = _gui_families.get(family)
+        if target is None:
+            raise ValueError(f"Unknown GUI family: {family}")
+        module_name, _, attr = target.partition(":")
+        factory = getattr(importlib.import_module(module_name), attr)()
+        if cached:
+            factory = CachingGUIFactory(factory)
+        _gui_factories[(family, cached)] = factory
+    return factory
+
+
 def afactory_create_ui():
     factory = MacOSFactory()
     print("Created Mac AFactory")
@@ -11,16 +11,17 @@ Usage:
 -------------------------------------------------
 """
 
+from array import array
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
 
 
+@dataclass(frozen=True, slots=True)
 class Car:
-
-    def __init__(self):
-        self.engine = None
-        self.wheels = None
-        self.doors = None
-        self.color = None
+    engine: str = None
+    wheels: int = None
+    doors: int = None
+    color: str = None
 
     def __str__(self):
         return f"Car with Engine: {self.engine}, Wheels: {self.wheels}, Doors: {self.doors}, Color: {self.color}"
@@ -52,65 +53,221 @@ class CarBuilder(ABC):
 class SedanCarBuilder(CarBuilder):
 
     def __init__(self):
-        self.car = Car()
+        self._parts = {}
 
     def set_engine(self, engine: str):
-        self.car.engine = engine
+        self._parts["engine"] = engine
         return self
 
     def set_wheels(self, wheels: int):
-        self.car.wheels = wheels
+        self._parts["wheels"] = wheels
         return self
 
     def set_doors(self, doors: int):
-        self.car.doors = doors
+        self._parts["doors"] = doors
         return self
 
     def set_color(self, color: str):
-        self.car.color = color
+        self._parts["color"] = color
         return self
 
     def get_result(self) -> Car:
-        return self.car
+        return Car(**self._parts)
 
 
 class SuvCarBuilder(CarBuilder):
 
     def __init__(self):
-        self.car = Car()
+        self._parts = {}
 
     def set_engine(self, engine: str):
-        self.car.engine = engine
+        self._parts["engine"] = engine
         return self
 
     def set_wheels(self, wheels: int):
-        self.car.wheels = wheels
+        self._parts["wheels"] = wheels
         return self
 
     def set_doors(self, doors: int):
-        self.car.doors = doors
+        self._parts["doors"] = doors
         return self
 
     def set_color(self, color: str):
-        self.car.color = color
+        self._parts["color"] = color
         return self
 
     def get_result(self) -> Car:
-        return self.car
+        return Car(**self._parts)
+
+
+class ConstructionPlan:
+    """
+    A recipe compiled once into a validated template Car. Since Car is
+    immutable, `build()` hands out the template itself; overrides produce a
+    new record from the precomputed parts and may not unset or add parts.
+    A variant built many times is cheapest compiled into its own plan.
+    """
+    __slots__ = ("template", "_parts")
+
+    def __init__(self, template: Car):
+        missing = [
+            field.name for field in fields(Car)
+            if getattr(template, field.name) is None
+        ]
+        if missing:
+            raise ValueError(f"Recipe leaves parts unset: {', '.join(missing)}")
+        self.template = template
+        self._parts = {
+            field.name: getattr(template, field.name)
+            for field in fields(Car)
+        }
+
+    def build(self, **overrides) -> Car:
+        if not overrides:
+            return self.template
+        if None in overrides.values():
+            unset = [name for name, value in overrides.items() if value is None]
+            raise ValueError(f"Overrides leave parts unset: {', '.join(unset)}")
+        try:
+            return Car(**{**self._parts, **overrides})
+        except TypeError:
+            unknown = overrides.keys() - self._parts.keys()
+            raise ValueError(
+                f"Unknown parts: {', '.join(sorted(unknown))}") from None
 
 
 class CarDirector:
+    RECIPES = {
+        "sedan": {
+            "engine": "V6 Engine",
+            "wheels": 4,
+            "doors": 4,
+            "color": "Black"
+        },
+        "suv": {
+            "engine": "V8 Engine",
+            "wheels": 4,
+            "doors": 5,
+            "color": "Silver"
+        },
+    }
 
     def __init__(self, builder: CarBuilder):
         self.builder = builder
+        # Plans depend on the builder's own state, so each director compiles
+        # its recipes once for the builder it was given.
+        self._plans = {}
+
+    def plan(self, recipe: str) -> ConstructionPlan:
+        plan = self._plans.get(recipe)
+        if plan is None:
+            plan = self._plans[recipe] = self._compile(recipe)
+        return plan
+
+    def _compile(self, recipe: str) -> ConstructionPlan:
+        parts = self.RECIPES.get(recipe)
+        if parts is None:
+            raise ValueError(f"Unknown recipe: {recipe}")
+        for part, value in parts.items():
+            getattr(self.builder, f"set_{part}")(value)
+        return ConstructionPlan(self.builder.get_result())
+
+    def construct_sedan(self, **overrides):
+        return self.plan("sedan").build(**overrides)
+
+    def construct_suv(self, **overrides):
+        return self.plan("suv").build(**overrides)
+
+
+class _CategoryColumn:
+
+    MAX_VALUES = 1 << 16
 
-    def construct_sedan(self):
-        return (self.builder.set_engine("V6 Engine").set_wheels(4).set_doors(
-            4).set_color("Black").get_result())
+    def __init__(self):
+        self.codes = array("H")
+        self.values = []
+        self._code_of = {}
+
+    def check(self, name: str, value):
+        if value is None:
+            raise ValueError(f"Car {name} is not set")
+        if value not in self._code_of and len(self.values) >= self.MAX_VALUES:
+            raise ValueError(
+                f"More than {self.MAX_VALUES} distinct {name} values")
+
+    def append(self, value):
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int):
+        return self.values[self.codes[index]]
+
+
+class CarTable:
+    """
+    Column-oriented inventory of cars. Engines and colors are dictionary
+    encoded; wheels and doors are stored as unsigned bytes.
+    """
+
+    def __init__(self):
+        self.engines = _CategoryColumn()
+        self.wheels = array("B")
+        self.doors = array("B")
+        self.colors = _CategoryColumn()
+
+    def append(self, engine: str, wheels: int, doors: int, color: str):
+        # Check the whole row first so a bad value cannot leave the columns
+        # with different lengths.
+        self.engines.check("engine", engine)
+        self.colors.check("color", color)
+        for name, value in (("wheels", wheels), ("doors", doors)):
+            if not isinstance(value, int) or not 0 <= value <= 255:
+                raise ValueError(f"Car {name} must be an int in 0..255, "
+                                 f"got {value!r}")
+        self.engines.append(engine)
+        self.wheels.append(wheels)
+        self.doors.append(doors)
+        self.colors.append(color)
+
+    def __len__(self):
+        return len(self.wheels)
+
+    def __getitem__(self, index: int) -> Car:
+        return Car(self.engines[index], self.wheels[index], self.doors[index],
+                   self.colors[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class BulkCarBuilder:
+    """
+    Streams car specs, either Car records or (engine, wheels, doors, color)
+    tuples, into a CarTable.
+    """
+
+    def __init__(self):
+        self._table = CarTable()
+
+    def add(self, spec):
+        if isinstance(spec, Car):
+            spec = (spec.engine, spec.wheels, spec.doors, spec.color)
+        self._table.append(*spec)
+        return self
+
+    def add_many(self, specs):
+        add = self.add
+        for spec in specs:
+            add(spec)
+        return self
 
-    def construct_suv(self):
-        return (self.builder.set_engine("V8 Engine").set_wheels(4).set_doors(
-            5).set_color("Silver").get_result())
+    def get_result(self) -> CarTable:
+        table, self._table = self._table, CarTable()
+        return table
 
 
 def builder_test():
@@ -0,0 +1,64 @@
+"""
+-------------------------------------------------
+File: builder_benchmark.py
+Intent:
+    Compares building cars through the fluent builder chain with the
+    compiled construction plans of CarDirector in builder.py.
+
+Usage:
+    python -m patterns.creational.builder_benchmark --output results.json
+-------------------------------------------------
+"""
+
+import sys
+import json
+import time
+import argparse
+
+from .builder import CarDirector, SedanCarBuilder
+
+
+def director_benchmark(builds: int = 100_000) -> dict:
+    builder = SedanCarBuilder()
+    start = time.perf_counter()
+    for _ in range(builds):
+        builder.set_engine("V6 Engine").set_wheels(4).set_doors(4).set_color(
+            "Black").get_result()
+    fluent = time.perf_counter() - start
+
+    director = CarDirector(builder)
+    start = time.perf_counter()
+    for _ in range(builds):
+        director.construct_sedan()
+    planned = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(builds):
+        director.construct_sedan(color="Red")
+    overridden = time.perf_counter() - start
+
+    return {
+        "builds": builds,
+        "fluent_per_second": builds / fluent,
+        "plan_per_second": builds / planned,
+        "plan_with_override_per_second": builds / overridden,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Car director benchmark")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    parser.add_argument("--builds", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    results = director_benchmark(args.builds)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,11 @@ Usage:
 -------------------------------------------------
 """
 
+from array import array
+from collections import Counter
+import importlib
+from contextlib import contextmanager
+from importlib import metadata
 from abc import ABC, abstractmethod
 
 
@@ -20,6 +25,9 @@ class Vehicle(ABC):
     def drive(self):
         pass
 
+    def reset(self):
+        """Return the vehicle to a clean state before it is pooled again."""
+
 
 class Car(Vehicle):
     name = "Car"
@@ -48,6 +56,10 @@ class VehicleFactory(ABC):
     def create_vehicle(self) -> Vehicle:
         pass
 
+    def create_many(self, count: int) -> list:
+        create_vehicle = self.create_vehicle
+        return [create_vehicle() for _ in range(count)]
+
 
 class CarFactory(VehicleFactory):
 
@@ -67,16 +79,225 @@ class TruckFactory(VehicleFactory):
         return Truck()
 
 
+class SimpleVehicleFactory(VehicleFactory):
+    """Factory for plugin `Vehicle` types that ship without their own factory."""
+
+    def __init__(self, vehicle_cls):
+        self.vehicle_cls = vehicle_cls
+
+    def create_vehicle(self) -> Vehicle:
+        return self.vehicle_cls()
+
+
+class VehicleFactoryRegistry:
+    """
+    Maps vehicle type names to factories. Factories are instantiated once and
+    cached, so dispatch is a single dict lookup. Lazy entries ("module:attr")
+    and plugins advertised under the `ENTRY_POINT_GROUP` entry point group are
+    only imported the first time their type is requested.
+    """
+    ENTRY_POINT_GROUP = "patterns.vehicles"
+
+    def __init__(self, entry_point_group: str = ENTRY_POINT_GROUP):
+        self._factories = {}
+        self._lazy = {}
+        self._entry_point_group = entry_point_group
+        self._entry_points_scanned = entry_point_group is None
+
+    def register(self, vehicle_type: str, factory):
+        self._factories[vehicle_type] = self._as_factory(factory)
+        self._lazy.pop(vehicle_type, None)
+
+    def register_lazy(self, vehicle_type: str, target: str):
+        self._lazy[vehicle_type] = target
+        self._factories.pop(vehicle_type, None)
+
+    def get(self, vehicle_type: str) -> VehicleFactory:
+        factory = self._factories.get(vehicle_type)
+        if factory is None:
+            factory = self._load(vehicle_type)
+        return factory
+
+    def create_vehicle(self, vehicle_type: str) -> Vehicle:
+        return self.get(vehicle_type).create_vehicle()
+
+    def create_many(self, vehicle_type: str, count: int) -> list:
+        return self.get(vehicle_type).create_many(count)
+
+    def create_from(self, vehicle_types) -> "Fleet":
+        fleet = Fleet(self)
+        fleet.extend(vehicle_types)
+        return fleet
+
+    def types(self):
+        self._scan_entry_points()
+        return sorted(self._factories.keys() | self._lazy.keys())
+
+    def _load(self, vehicle_type: str) -> VehicleFactory:
+        if vehicle_type not in self._lazy:
+            self._scan_entry_points()
+        target = self._lazy.get(vehicle_type)
+        if target is None:
+            raise ValueError(f"Unknown vehicle type: {vehicle_type}")
+
+        if isinstance(target, metadata.EntryPoint):
+            loaded = target.load()
+        else:
+            module_name, _, attr = target.partition(":")
+            loaded = getattr(importlib.import_module(module_name), attr)
+
+        factory = self._as_factory(loaded)
+        # Forget the lazy target only once it loaded, so a failed import is
+        # retried on the next request instead of the type disappearing.
+        del self._lazy[vehicle_type]
+        self._factories[vehicle_type] = factory
+        return factory
+
+    def _scan_entry_points(self):
+        if self._entry_points_scanned:
+            return
+        self._entry_points_scanned = True
+        for entry_point in metadata.entry_points(
+                group=self._entry_point_group):
+            if entry_point.name not in self._factories:
+                self._lazy.setdefault(entry_point.name, entry_point)
+
+    @staticmethod
+    def _as_factory(obj) -> VehicleFactory:
+        if isinstance(obj, VehicleFactory):
+            return obj
+        if isinstance(obj, type) and issubclass(obj, VehicleFactory):
+            return obj()
+        if isinstance(obj, type) and issubclass(obj, Vehicle):
+            return SimpleVehicleFactory(obj)
+        raise TypeError(f"Cannot register {obj!r} as a vehicle factory")
+
+
+vehicle_factories = VehicleFactoryRegistry()
+vehicle_factories.register("car", CarFactory)
+vehicle_factories.register("bike", BikeFactory)
+vehicle_factories.register("truck", TruckFactory)
+
+
+class Fleet:
+    """
+    Columnar container of stateless vehicles: one type code per vehicle plus
+    one template vehicle per type. Fleet-wide operations call each template
+    once and fan the result out, instead of dispatching per vehicle.
+    """
+
+    def __init__(self, registry: VehicleFactoryRegistry = None):
+        self._registry = registry or vehicle_factories
+        self.codes = array("H")
+        self.type_names = []
+        self._templates = []
+        self._code_of = {}
+
+    def _code(self, vehicle_type: str) -> int:
+        code = self._code_of.get(vehicle_type)
+        if code is None:
+            template = self._registry.create_vehicle(vehicle_type)
+            code = len(self.type_names)
+            self.type_names.append(vehicle_type)
+            self._templates.append(template)
+            self._code_of[vehicle_type] = code
+        return code
+
+    def add(self, vehicle_type: str, count: int = 1):
+        self.codes.extend(array("H", [self._code(vehicle_type)]) * count)
+
+    def extend(self, vehicle_types):
+        code_of = self._code_of
+        code = self._code
+        self.codes.extend(
+            code_of[name] if name in code_of else code(name)
+            for name in vehicle_types)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Vehicle:
+        return self._registry.create_vehicle(
+            self.type_names[self.codes[index]])
+
+    def counts(self) -> dict:
+        totals = Counter(self.codes)
+        return {name: totals[code] for code, name in enumerate(self.type_names)}
+
+    def drive(self) -> list:
+        results = [template.drive() for template in self._templates]
+        return [results[code] for code in self.codes]
+
+
+class VehiclePool:
+    """
+    Recycles vehicles created through a registry. Each vehicle type keeps at
+    most `max_size` idle instances; releasing into a full pool evicts the
+    vehicle. `reset()` is called on every released vehicle, or `reset_hook`
+    when one is given. Only vehicles currently leased from this pool may be
+    released, and each only once per lease.
+    """
+
+    def __init__(self,
+                 registry: VehicleFactoryRegistry = None,
+                 max_size: int = 64,
+                 reset_hook=None):
+        self._registry = registry or vehicle_factories
+        self._max_size = max_size
+        self._reset_hook = reset_hook
+        self._idle = {}
+        self._leased = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, vehicle_type: str) -> Vehicle:
+        idle = self._idle.get(vehicle_type)
+        if idle:
+            self.hits += 1
+            vehicle = idle.pop()
+        else:
+            self.misses += 1
+            vehicle = self._registry.create_vehicle(vehicle_type)
+        self._leased[id(vehicle)] = (vehicle_type, vehicle)
+        return vehicle
+
+    def release(self, vehicle: Vehicle):
+        leased = self._leased.get(id(vehicle))
+        if leased is None or leased[1] is not vehicle:
+            raise ValueError(f"{vehicle!r} is not leased from this pool")
+        del self._leased[id(vehicle)]
+        vehicle_type = leased[0]
+        idle = self._idle.setdefault(vehicle_type, [])
+        if len(idle) >= self._max_size:
+            self.evictions += 1
+            return
+        if self._reset_hook is None:
+            vehicle.reset()
+        else:
+            self._reset_hook(vehicle)
+        idle.append(vehicle)
+
+    @contextmanager
+    def lease(self, vehicle_type: str):
+        vehicle = self.acquire(vehicle_type)
+        try:
+            yield vehicle
+        finally:
+            self.release(vehicle)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "leased": len(self._leased),
+            "idle": {name: len(idle)
+                     for name, idle in self._idle.items()},
+        }
+
+
 def get_vehicle_to_drive(vehicle_type: str):
-    if vehicle_type == 'car':
-        factory = CarFactory()
-    elif vehicle_type == 'bike':
-        factory = BikeFactory()
-    elif vehicle_type == 'truck':
-        factory = TruckFactory()
-    else:
-        raise ValueError(f"Unknown vehicle type: {vehicle_type}")
-
-    vehicle = factory.create_vehicle()
+    vehicle = vehicle_factories.create_vehicle(vehicle_type)
     print(f"Created Vehicles: {vehicle.name}")
     print(vehicle.drive(), '\n')
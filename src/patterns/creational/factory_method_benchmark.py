@@ -0,0 +1,56 @@
+"""
+-------------------------------------------------
+File: factory_method_benchmark.py
+Intent:
+    Compares creating a fresh vehicle per call with leasing one from the
+    VehiclePool in factory_method.py.
+
+Usage:
+    python -m patterns.creational.factory_method_benchmark --output results.json
+-------------------------------------------------
+"""
+
+import sys
+import json
+import time
+import argparse
+
+from .factory_method import VehiclePool, vehicle_factories
+
+
+def vehicle_pool_benchmark(iterations: int = 1_000_000,
+                           vehicle_type: str = "car") -> dict:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        vehicle_factories.create_vehicle(vehicle_type).drive()
+    unpooled = time.perf_counter() - start
+
+    pool = VehiclePool()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        vehicle = pool.acquire(vehicle_type)
+        vehicle.drive()
+        pool.release(vehicle)
+    pooled = time.perf_counter() - start
+
+    return {"unpooled": unpooled, "pooled": pooled, **pool.stats()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vehicle pool benchmark")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    parser.add_argument("--vehicle-type", default="car")
+    args = parser.parse_args(argv)
+
+    results = vehicle_pool_benchmark(args.iterations, args.vehicle_type)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
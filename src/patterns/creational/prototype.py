@@ -11,7 +11,14 @@ Usage:
 -------------------------------------------------
 """
 
+import os
 import copy
+import mmap
+import array
+import tempfile
+import itertools
+import threading
+from collections import deque
 from abc import ABC, abstractmethod
 
 
@@ -38,18 +45,441 @@ class TextDocument(Document):
         return f"TextDocument Content: {self.content}"
 
 
+def _freeze(item):
+    """Store rows as tuples (and sets as frozensets) so clones can share them."""
+    if isinstance(item, (list, tuple)):
+        return tuple(map(_freeze, item))
+    if isinstance(item, (set, frozenset)):
+        return frozenset(item)
+    return item
+
+
+class CopyOnWriteList:
+    """
+    List split into fixed-size chunks that clones share until one of them
+    writes. A write copies only the chunk it touches, so cloning costs one
+    pointer per chunk instead of a copy of every item. Rows are stored as
+    tuples, so a row can only change through `data[i] = row`, which never
+    reaches another clone. Other mutable objects are shared, not copied.
+    """
+    __slots__ = ("_chunks", "_owned", "_chunk_size", "_length")
+
+    def __init__(self, items=(), chunk_size: int = 1024):
+        items = [_freeze(item) for item in items]
+        self._chunk_size = chunk_size
+        self._chunks = [
+            items[start:start + chunk_size]
+            for start in range(0, len(items), chunk_size)
+        ]
+        self._owned = bytearray(b"\x01" * len(self._chunks))
+        self._length = len(items)
+
+    def clone(self) -> "CopyOnWriteList":
+        other = object.__new__(CopyOnWriteList)
+        other._chunk_size = self._chunk_size
+        other._chunks = self._chunks[:]
+        other._length = self._length
+        # Every chunk is now shared, so neither side may write in place.
+        self._owned = bytearray(len(self._chunks))
+        other._owned = bytearray(len(self._chunks))
+        return other
+
+    def _position(self, index: int):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CopyOnWriteList index out of range")
+        return divmod(index, self._chunk_size)
+
+    def _writable_chunk(self, chunk: int) -> list:
+        if not self._owned[chunk]:
+            self._chunks[chunk] = self._chunks[chunk][:]
+            self._owned[chunk] = 1
+        return self._chunks[chunk]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        chunk, offset = self._position(index)
+        return self._chunks[chunk][offset]
+
+    def __setitem__(self, index: int, value):
+        chunk, offset = self._position(index)
+        self._writable_chunk(chunk)[offset] = _freeze(value)
+
+    def append(self, value):
+        if not self._chunks or len(self._chunks[-1]) == self._chunk_size:
+            self._chunks.append([])
+            self._owned.append(1)
+        self._writable_chunk(len(self._chunks) - 1).append(_freeze(value))
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._chunks)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class PersistentList:
+    """
+    List backed by a 32-way trie. Nodes are never modified once shared:
+    `clone()` shares the root in O(1), and a write copies only the O(log n)
+    nodes on the path to the changed item, so many near-identical versions
+    cost memory proportional to their edits. Nodes this version created
+    since its last clone are tracked by id and updated in place. As with
+    CopyOnWriteList, rows are stored as tuples.
+    """
+    __slots__ = ("_root", "_shift", "_length", "_owned")
+    BITS = 5
+    WIDTH = 1 << BITS
+    MASK = WIDTH - 1
+
+    def __init__(self, items=()):
+        nodes = [_freeze(item) for item in items]
+        self._length = len(nodes)
+        self._shift = 0
+        self._owned = set()
+        nodes = [
+            nodes[start:start + self.WIDTH]
+            for start in range(0, len(nodes), self.WIDTH)
+        ] or [[]]
+        while len(nodes) > 1:
+            nodes = [
+                nodes[start:start + self.WIDTH]
+                for start in range(0, len(nodes), self.WIDTH)
+            ]
+            self._shift += self.BITS
+        self._root = nodes[0]
+
+    def clone(self) -> "PersistentList":
+        other = object.__new__(PersistentList)
+        other._root = self._root
+        other._shift = self._shift
+        other._length = self._length
+        # Every node is now shared, so neither side may write in place.
+        self._owned = set()
+        other._owned = set()
+        return other
+
+    def _check(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PersistentList index out of range")
+        return index
+
+    def _own(self, node: list) -> list:
+        if id(node) in self._owned:
+            return node
+        node = node[:]
+        self._owned.add(id(node))
+        return node
+
+    def _leaf(self, index: int) -> list:
+        node = self._root
+        for shift in range(self._shift, 0, -self.BITS):
+            node = node[(index >> shift) & self.MASK]
+        return node
+
+    def _writable_leaf(self, index: int) -> list:
+        node = self._root = self._own(self._root)
+        for shift in range(self._shift, 0, -self.BITS):
+            slot = (index >> shift) & self.MASK
+            if slot == len(node):
+                node.append([])
+                self._owned.add(id(node[slot]))
+            child = node[slot] = self._own(node[slot])
+            node = child
+        return node
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        index = self._check(index)
+        return self._leaf(index)[index & self.MASK]
+
+    def __setitem__(self, index: int, value):
+        index = self._check(index)
+        self._writable_leaf(index)[index & self.MASK] = _freeze(value)
+
+    def append(self, value):
+        index = self._length
+        if index == self.WIDTH << self._shift:
+            self._root = [self._root]
+            self._owned.add(id(self._root))
+            self._shift += self.BITS
+        self._writable_leaf(index).append(_freeze(value))
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        stack = [(self._root, self._shift)]
+        while stack:
+            node, shift = stack.pop()
+            if shift == 0:
+                yield from node
+            else:
+                stack.extend((child, shift - self.BITS)
+                             for child in reversed(node))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class SpreadsheetDocument(Document):
+    STORAGES = {
+        "list": list,
+        "cow": CopyOnWriteList,
+        "persistent": PersistentList
+    }
 
-    def __init__(self, data: list):
-        self.data = data
+    def __init__(self, data: list, storage: str = "list"):
+        if storage not in self.STORAGES:
+            raise ValueError(f"Unknown spreadsheet storage: {storage}")
+        self.storage = storage
+        self.data = data if storage == "list" else self.STORAGES[storage](
+            data)
 
     def clone(self):
-        return copy.deepcopy(self)
+        if self.storage == "list":
+            return copy.deepcopy(self)
+        other = copy.copy(self)
+        other.data = self.data.clone()
+        return other
 
     def display(self):
         return f"SpreadsheetDocument Data: {self.data}"
 
 
+class ArraySpreadsheetDocument(Document):
+    """
+    Numeric spreadsheet stored as a flat `array.array` of one typecode, or
+    mapped from a file with `open()`. A mapped document uses a private
+    copy-on-write mapping (`ACCESS_COPY`): its `data` is a read-only view,
+    edits go through `set()` and never reach the file. Edits are also kept
+    in a small index-to-value overlay, so a clone maps the same open file
+    again and replays only the overlay instead of copying the sheet. Clones
+    keep the file's inode, so replacing the file by rename is
+    safe, but the file must not be modified or truncated in place while
+    documents map it: untouched pages would change, or fault on access.
+    `save()` therefore writes a new file and renames it into place.
+    """
+    DISPLAY_LIMIT = 10
+
+    def __init__(self, data=(), typecode: str = "d"):
+        self.typecode = typecode
+        self.data = array.array(typecode, data)
+        self._fd = None
+        self._mmap = None
+        self._view = None
+        self._edits = {}
+
+    @classmethod
+    def open(cls, path, typecode: str = "d"):
+        document = cls(typecode=typecode)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size % document.data.itemsize:
+                raise ValueError(
+                    f"{path} does not hold whole '{typecode}' items")
+            if size:
+                document._fd = fd
+                document._map_file()
+                return document
+        except BaseException:
+            document._fd = None
+            os.close(fd)
+            raise
+        # mmap cannot map an empty file; an empty sheet needs no mapping.
+        os.close(fd)
+        return document
+
+    def _map_file(self):
+        self._mmap = mmap.mmap(self._fd, 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._mmap).cast(self.typecode)
+        self.data = self._view.toreadonly()
+
+    def set(self, index: int, value):
+        if self._view is None:
+            self.data[index] = value
+        else:
+            self._view[index] = value
+            index = range(len(self._view))[index]
+            self._edits[index] = self._view[index]
+
+    def save(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self.data)
+            mode = os.stat(path).st_mode if os.path.exists(path) else 0o644
+            os.chmod(temp_path, mode & 0o777)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def clone(self):
+        other = copy.copy(self)
+        if self._mmap is not None:
+            other._fd = os.dup(self._fd)
+            other._map_file()
+            other._edits = dict(self._edits)
+            for index, value in other._edits.items():
+                other._view[index] = value
+        else:
+            other.data = array.array(self.typecode)
+            other.data.frombytes(memoryview(self.data).cast("B"))
+        return other
+
+    def close(self):
+        if self._mmap is not None:
+            self.data.release()
+            self._view.release()
+            self._mmap.close()
+            os.close(self._fd)
+            self._fd = self._mmap = self._view = None
+            self._edits = {}
+            self.data = array.array(self.typecode)
+
+    def display(self):
+        head = ", ".join(
+            str(value) for value in self.data[:self.DISPLAY_LIMIT].tolist())
+        more = len(self.data) - self.DISPLAY_LIMIT
+        suffix = f", ... {more} more" if more > 0 else ""
+        return f"ArraySpreadsheetDocument Data: [{head}{suffix}]"
+
+
+class PrototypeRegistry:
+    """
+    Named prototypes with a pool of ready-made clones each. `clone(name)`
+    pops a pooled copy; once a pool drops to its low watermark, a background
+    thread refills it to `pool_size`, keeping copying off the request path.
+    """
+
+    def __init__(self, pool_size: int = 8, low_watermark: int = 2):
+        self.pool_size = pool_size
+        self.low_watermark = low_watermark
+        self._prototypes = {}
+        self._pools = {}
+        self._limits = {}
+        self._stats = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._refill_needed = threading.Condition(self._lock)
+        self._thread = None
+        self._closed = False
+
+    def register(self,
+                 name: str,
+                 prototype: Document,
+                 pool_size: int = None,
+                 low_watermark: int = None):
+        with self._lock:
+            self._prototypes[name] = prototype
+            self._pools[name] = deque()
+            self._limits[name] = (
+                self.pool_size if pool_size is None else pool_size,
+                self.low_watermark
+                if low_watermark is None else low_watermark)
+            self._stats[name] = {"hits": 0, "misses": 0, "refill_errors": 0}
+            self._request_refill(name)
+
+    def unregister(self, name: str):
+        with self._lock:
+            del self._prototypes[name]
+            del self._pools[name]
+            del self._limits[name]
+            del self._stats[name]
+            self._pending.discard(name)
+
+    def clone(self, name: str) -> Document:
+        with self._lock:
+            prototype = self._prototypes.get(name)
+            if prototype is None:
+                raise ValueError(f"Unknown prototype: {name}")
+            pool = self._pools[name]
+            document = pool.popleft() if pool else None
+            self._stats[name]["misses" if document is None else "hits"] += 1
+            if len(pool) <= self._limits[name][1]:
+                self._request_refill(name)
+        if document is None:
+            document = prototype.clone()
+        return document
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                name: {
+                    **counts, "pooled": len(self._pools[name])
+                }
+                for name, counts in self._stats.items()
+            }
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._refill_needed.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _request_refill(self, name: str):
+        if self._closed:
+            return
+        self._pending.add(name)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._refill_loop,
+                                            name="prototype-refill",
+                                            daemon=True)
+            self._thread.start()
+        self._refill_needed.notify()
+
+    def _refill_loop(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._refill_needed.wait()
+                if self._closed:
+                    return
+                name = self._pending.pop()
+                prototype = self._prototypes[name]
+                missing = self._limits[name][0] - len(self._pools[name])
+
+            for _ in range(missing):
+                try:
+                    document = prototype.clone()
+                except Exception:
+                    # Drop this refill; the next low-watermark hit retries it.
+                    with self._lock:
+                        if name in self._stats:
+                            self._stats[name]["refill_errors"] += 1
+                    break
+                with self._lock:
+                    if self._prototypes.get(name) is not prototype:
+                        break
+                    self._pools[name].append(document)
+
+
 def create_document_clone():
     document = TextDocument("Hello World, My First Document")
     print(f"Created Document: {document.display()}")
@@ -0,0 +1,60 @@
+"""
+-------------------------------------------------
+File: prototype_benchmark.py
+Intent:
+    Measures clone latency and peak clone memory of the copy-on-write and
+    persistent spreadsheet storages in prototype.py against deepcopy.
+
+Usage:
+    python -m patterns.creational.prototype_benchmark --output results.json
+-------------------------------------------------
+"""
+
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+from .prototype import SpreadsheetDocument
+
+
+def clone_benchmark(cells: int = 1_000_000, storage: str = "cow") -> dict:
+    results = {}
+    for name in ("list", storage):
+        document = SpreadsheetDocument(list(range(cells)), storage=name)
+        start = time.perf_counter()
+        document.clone()
+        elapsed = time.perf_counter() - start
+        # Memory is traced in a separate clone so tracing does not skew timing.
+        tracemalloc.start()
+        document.clone()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {"clone_seconds": elapsed, "clone_peak_bytes": peak}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spreadsheet clone benchmark")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    parser.add_argument("--cells", type=int, default=1_000_000)
+    parser.add_argument("--storage",
+                        choices=[
+                            name for name in SpreadsheetDocument.STORAGES
+                            if name != "list"
+                        ],
+                        default="cow")
+    args = parser.parse_args(argv)
+
+    results = clone_benchmark(args.cells, args.storage)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -37,21 +37,254 @@ Usage:
    *** Solution of Race Condition
 '''
 
+import os
+import array
+import asyncio
 import threading
+import contextvars
+from multiprocessing import resource_tracker, shared_memory
 
 
 class SingletonMeta(type):
     _instances = {}
-    _lock = threading.Lock()
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        # One lock per class, so a slow constructor only blocks its own class.
+        cls._singleton_lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            with cls._lock:
+            with cls._singleton_lock:
                 if cls not in cls._instances:
-                    cls._instances[cls] = super(SingletonMeta,
-                                                cls).__call__(*args, **kwargs)
+                    cls._instances[cls] = cls._create_instance(*args, **kwargs)
         return cls._instances[cls]
 
+    def _create_instance(cls, *args, **kwargs):
+        return super(SingletonMeta, cls).__call__(*args, **kwargs)
+
+
+'''
+   *** Async Singleton
+'''
+
+
+class AsyncSingletonMeta(type):
+    """
+    Calling the class returns an awaitable: `instance = await MyClass()`.
+    The optional `async_init()` coroutine runs exactly once; concurrent
+    awaiters share the pending future instead of blocking the event loop.
+    """
+    _instances = {}
+    _pending = {}
+
+    def __call__(cls, *args, **kwargs):
+        return cls._get_instance(*args, **kwargs)
+
+    async def _get_instance(cls, *args, **kwargs):
+        if cls in cls._instances:
+            return cls._instances[cls]
+        future = cls._pending.get(cls)
+        if future is None:
+            future = asyncio.ensure_future(cls._create(*args, **kwargs))
+            cls._pending[cls] = future
+        # Shield so one cancelled awaiter does not cancel the shared creation.
+        return await asyncio.shield(future)
+
+    async def _create(cls, *args, **kwargs):
+        try:
+            instance = super(AsyncSingletonMeta, cls).__call__(*args, **kwargs)
+            async_init = getattr(instance, "async_init", None)
+            if async_init is not None:
+                await async_init()
+            cls._instances[cls] = instance
+            return instance
+        finally:
+            cls._pending.pop(cls, None)
+
+
+'''
+   *** Fork-safe and Process-shared Singletons
+'''
+
+
+class ForkSafeSingletonMeta(SingletonMeta):
+    """
+    Instances are dropped in a forked child and re-created lazily on first
+    access, and the per-class lock is replaced in case it was held at fork time.
+    """
+    _fork_safe_classes = []
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        ForkSafeSingletonMeta._fork_safe_classes.append(cls)
+
+    @staticmethod
+    def _reset_after_fork():
+        for cls in ForkSafeSingletonMeta._fork_safe_classes:
+            cls._singleton_lock = threading.Lock()
+            instance = cls._instances.pop(cls, None)
+            after_fork = getattr(instance, "after_fork", None)
+            if after_fork is not None:
+                after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=ForkSafeSingletonMeta._reset_after_fork)
+
+
+class SharedState:
+    """
+    Flat array of fixed-width values kept in a `multiprocessing.shared_memory`
+    block. `values` is a memoryview over the block, so reads never copy it.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, typecode: str,
+                 length: int, owner: bool):
+        self._shm = shm
+        self._owner_pid = os.getpid() if owner else None
+        self.typecode = typecode
+        self.values = shm.buf.cast(typecode)[:length]
+
+    @classmethod
+    def publish(cls, values, typecode: str, name: str = None):
+        data = array.array(typecode, values)
+        shm = shared_memory.SharedMemory(name=name,
+                                         create=True,
+                                         size=max(1,
+                                                  len(data) * data.itemsize))
+        shm.buf[:len(data) * data.itemsize] = data.tobytes()
+        return cls(shm, typecode, len(data), owner=True)
+
+    @classmethod
+    def attach(cls, name: str, typecode: str):
+        shm = shared_memory.SharedMemory(name=name)
+        # Attaching must not hand the segment over to this process' tracker,
+        # otherwise it would be unlinked when this worker exits.
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, typecode,
+                   shm.size // array.array(typecode).itemsize, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self):
+        self.values.release()
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+
+
+class ProcessSharedSingletonMeta(ForkSafeSingletonMeta):
+    """
+    Classes declare `shared_typecode` and a `load_shared()` classmethod that
+    returns the values to publish. The values are published once per class
+    (or attached by `shared_name` in spawned workers) and exposed to every
+    instance as `self.shared`, so N workers read one copy of the table.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._shared_state = None
+
+    def _create_instance(cls, *args, **kwargs):
+        if cls._shared_state is None:
+            cls._shared_state = cls._open_shared_state()
+        instance = super()._create_instance(*args, **kwargs)
+        instance.shared = cls._shared_state.values
+        return instance
+
+    def _open_shared_state(cls):
+        name = getattr(cls, "shared_name", None)
+        if name is not None:
+            try:
+                return SharedState.attach(name, cls.shared_typecode)
+            except FileNotFoundError:
+                pass
+        return SharedState.publish(cls.load_shared(), cls.shared_typecode,
+                                   name)
+
+
+'''
+   *** Scoped Singletons
+'''
+
+
+class ThreadLocalSingletonMeta(type):
+    """One instance per thread; no lock is needed on the hot path."""
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._thread_local = threading.local()
+
+    def __call__(cls, *args, **kwargs):
+        instance = getattr(cls._thread_local, "instance", None)
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            cls._thread_local.instance = instance
+        return instance
+
+    def discard(cls):
+        instance = cls._thread_local.__dict__.pop("instance", None)
+        close = getattr(instance, "close", None)
+        if close is not None:
+            close()
+
+
+_current_scope = contextvars.ContextVar("current_scope", default=None)
+
+
+class Scope:
+    """
+    Holds one instance per class for as long as the scope is open. Entering
+    the scope makes it current for the running thread or asyncio task
+    (through `contextvars`), so each request or task sees its own instances.
+    Closing calls `close()` on the instances in reverse creation order.
+    """
+
+    def __init__(self):
+        self._instances = {}
+        self._token = None
+
+    @staticmethod
+    def current():
+        return _current_scope.get()
+
+    def get(self, cls, *args, **kwargs):
+        instance = self._instances.get(cls)
+        if instance is None:
+            instance = type.__call__(cls, *args, **kwargs)
+            self._instances[cls] = instance
+        return instance
+
+    def close(self):
+        instances, self._instances = self._instances, {}
+        for instance in reversed(list(instances.values())):
+            close = getattr(instance, "close", None)
+            if close is not None:
+                close()
+
+    def __enter__(self):
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_scope.reset(self._token)
+        self._token = None
+        self.close()
+
+
+class ScopedSingletonMeta(type):
+    """One instance per active `Scope`."""
+
+    def __call__(cls, *args, **kwargs):
+        scope = _current_scope.get()
+        if scope is None:
+            raise RuntimeError(f"No active scope for {cls.__name__}")
+        return scope.get(cls, *args, **kwargs)
+
 
 class Singleton(metaclass=SingletonMeta):
     pass
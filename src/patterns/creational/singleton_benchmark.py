@@ -0,0 +1,169 @@
+"""
+-------------------------------------------------
+File: singleton_benchmark.py
+Intent:
+    Measures the cost of the singleton accessors in singleton.py:
+    first-access latency under contention, steady-state call cost and
+    lock acquisitions, compared against simpler alternatives.
+
+Usage:
+    python -m patterns.creational.singleton_benchmark --output results.json
+-------------------------------------------------
+"""
+
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import functools
+import threading
+
+from .singleton import SingletonMeta
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class CountingLock:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self.acquisitions += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._lock.release()
+
+
+class AlwaysLockSingletonMeta(type):
+    """Takes the lock on every call, for comparison with double-checking."""
+    _instances = {}
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._singleton_lock = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        with cls._singleton_lock:
+            if cls not in cls._instances:
+                cls._instances[cls] = super().__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+def _make_metaclass_accessor(metaclass):
+    counter = {"constructions": 0}
+
+    class Subject(metaclass=metaclass):
+
+        def __init__(self):
+            counter["constructions"] += 1
+
+    lock = CountingLock()
+    Subject._singleton_lock = lock
+    return Subject, lock, counter
+
+
+def _make_cached_accessor():
+    counter = {"constructions": 0}
+
+    class Subject:
+
+        def __init__(self):
+            counter["constructions"] += 1
+
+    return functools.cache(Subject), None, counter
+
+
+IMPLEMENTATIONS = {
+    "double_checked_meta":
+    lambda: _make_metaclass_accessor(SingletonMeta),
+    "always_lock_meta":
+    lambda: _make_metaclass_accessor(AlwaysLockSingletonMeta),
+    "functools_cache": _make_cached_accessor,
+}
+
+
+def first_access_latency(factory, thread_count: int) -> dict:
+    accessor, lock, counter = factory()
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker():
+        barrier.wait()
+        accessor()
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "threads": thread_count,
+        "seconds": elapsed,
+        "constructions": counter["constructions"],
+        "lock_acquisitions": lock.acquisitions if lock else None,
+    }
+
+
+def steady_state_cost(calls: int) -> dict:
+    results = {}
+    for name, factory in IMPLEMENTATIONS.items():
+        accessor, lock, _ = factory()
+        accessor()
+        seconds = timeit.timeit(accessor, number=calls)
+        results[name] = {
+            "ns_per_call": seconds / calls * 1e9,
+            "lock_acquisitions": lock.acquisitions if lock else None,
+        }
+
+    module_global = object()
+    seconds = timeit.timeit(lambda: module_global, number=calls)
+    results["module_global"] = {
+        "ns_per_call": seconds / calls * 1e9,
+        "lock_acquisitions": None,
+    }
+    return results
+
+
+def run_benchmark(thread_counts=THREAD_COUNTS, calls: int = 1_000_000) -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "first_access": {
+            name: [first_access_latency(factory, n) for n in thread_counts]
+            for name, factory in IMPLEMENTATIONS.items()
+        },
+        "steady_state": steady_state_cost(calls),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Singleton accessor benchmark")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--threads",
+                        type=int,
+                        nargs="+",
+                        default=list(THREAD_COUNTS))
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.threads, args.calls)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
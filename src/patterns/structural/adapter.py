@@ -11,7 +11,18 @@ Usage:
 -------------------------------------------------
 """
 
+import json
+import time
+import uuid
+import random
+import socket
+import asyncio
+import inspect
+import threading
+import http.client
+from contextlib import contextmanager
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 
 class PaymentProcessor(ABC):
@@ -36,6 +47,364 @@ class StripeAdapter(PaymentProcessor):
         self.stripe.make_payment(amount)
 
 
+@dataclass
+class PaymentResult:
+    amount: float
+    ok: bool
+    receipt: object = None
+    error: Exception = None
+
+
+class AsyncPaymentProcessor(ABC):
+
+    @abstractmethod
+    async def pay(self, amount):
+        pass
+
+    async def pay_many(self, amounts) -> list:
+        return [await self._settle(amount) for amount in amounts]
+
+    async def _settle(self, amount) -> PaymentResult:
+        try:
+            return PaymentResult(amount, True, await self.pay(amount))
+        except Exception as error:
+            return PaymentResult(amount, False, error=error)
+
+
+class AsyncStripeAdapter(AsyncPaymentProcessor):
+    """
+    Runs payments concurrently, at most `concurrency` at a time. When the
+    adaptee offers `make_payments(amounts)`, amounts are sent in batches of
+    `batch_size` instead. Blocking adaptees are run in worker threads.
+    """
+
+    def __init__(self, stripe, concurrency: int = 16, batch_size: int = 100):
+        self.stripe = stripe
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+
+    async def pay(self, amount):
+        return await self._call(self.stripe.make_payment, amount)
+
+    async def pay_many(self, amounts) -> list:
+        amounts = list(amounts)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        if hasattr(self.stripe, "make_payments"):
+            batches = [
+                amounts[start:start + self.batch_size]
+                for start in range(0, len(amounts), self.batch_size)
+            ]
+
+            async def settle_batch(batch):
+                async with semaphore:
+                    return await self._settle_batch(batch)
+
+            settled = await asyncio.gather(*map(settle_batch, batches))
+            return [result for batch in settled for result in batch]
+
+        async def settle(amount):
+            async with semaphore:
+                return await self._settle(amount)
+
+        return await asyncio.gather(*map(settle, amounts))
+
+    async def _settle_batch(self, batch) -> list:
+        try:
+            receipts = await self._call(self.stripe.make_payments, batch)
+        except Exception as error:
+            return [PaymentResult(amount, False, error=error) for amount in batch]
+        results = [
+            PaymentResult(amount, False, error=receipt) if isinstance(
+                receipt, Exception) else PaymentResult(amount, True, receipt)
+            for amount, receipt in zip(batch, receipts)
+        ]
+        missing = RuntimeError(f"Batch endpoint returned {len(receipts)} "
+                               f"receipts for {len(batch)} payments")
+        results.extend(
+            PaymentResult(amount, False, error=missing)
+            for amount in batch[len(results):])
+        return results
+
+    @staticmethod
+    async def _call(method, *args):
+        if inspect.iscoroutinefunction(method):
+            return await method(*args)
+        return await asyncio.to_thread(method, *args)
+
+
+class FakeStripeGateway:
+    """In-process stand-in for a payment gateway that simulates latency."""
+
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self.calls = 0
+
+    @staticmethod
+    def _receipt(amount):
+        if amount <= 0:
+            return ValueError(f"Invalid amount: {amount}")
+        return f"receipt-{amount}"
+
+    async def make_payment(self, amount):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        receipt = self._receipt(amount)
+        if isinstance(receipt, Exception):
+            raise receipt
+        return receipt
+
+
+class FakeBatchStripeGateway(FakeStripeGateway):
+
+    async def make_payments(self, amounts):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return [self._receipt(amount) for amount in amounts]
+
+
+class BlockingFakeStripeGateway(FakeStripeGateway):
+
+    def make_payment(self, amount):
+        self.calls += 1
+        time.sleep(self.latency)
+        receipt = self._receipt(amount)
+        if isinstance(receipt, Exception):
+            raise receipt
+        return receipt
+
+
+class _NoDelayHTTPConnection(http.client.HTTPConnection):
+    # http.client sends headers and body separately; without TCP_NODELAY a
+    # reused connection stalls on delayed ACKs.
+
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+@dataclass
+class PoolMetrics:
+    in_use: int = 0
+    idle: int = 0
+    created: int = 0
+    acquired: int = 0
+    wait_seconds: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        if not self.acquired:
+            return 0.0
+        return (self.acquired - self.created) / self.acquired
+
+
+class ConnectionPool:
+    """
+    Bounded pool of keep-alive HTTP connections to one host. `acquire()`
+    waits up to `timeout` seconds for a free slot. With `keep_alive=False`
+    every connection is closed after use, which is the unpooled baseline.
+    """
+
+    def __init__(self,
+                 host: str,
+                 port: int = None,
+                 max_size: int = 10,
+                 timeout: float = 5.0,
+                 keep_alive: bool = True):
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.metrics = PoolMetrics()
+        self._idle = []
+        self._available = threading.Condition()
+
+    def acquire(self) -> http.client.HTTPConnection:
+        start = time.perf_counter()
+        with self._available:
+            if not self._available.wait_for(
+                    lambda: self._idle or self.metrics.in_use < self.max_size,
+                    self.timeout):
+                raise TimeoutError(
+                    f"No connection to {self.host} within {self.timeout}s")
+            self.metrics.wait_seconds += time.perf_counter() - start
+            self.metrics.acquired += 1
+            self.metrics.in_use += 1
+            if self._idle:
+                self.metrics.idle -= 1
+                return self._idle.pop()
+            self.metrics.created += 1
+        return _NoDelayHTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def release(self, connection: http.client.HTTPConnection,
+                reusable: bool = True):
+        if not (reusable and self.keep_alive):
+            connection.close()
+        with self._available:
+            self.metrics.in_use -= 1
+            if reusable and self.keep_alive:
+                self._idle.append(connection)
+                self.metrics.idle += 1
+            self._available.notify()
+
+    @contextmanager
+    def connection(self):
+        connection = self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            self.release(connection, reusable=False)
+            raise
+        self.release(connection)
+
+    def close(self):
+        with self._available:
+            idle, self._idle = self._idle, []
+            self.metrics.idle = 0
+        for connection in idle:
+            connection.close()
+
+
+class RetryBudget:
+    """
+    Token bucket for retries: each request deposits `ratio` tokens and each
+    retry spends one. The balance never exceeds `max_tokens`, so a long
+    healthy stretch cannot bank a burst of retries for the next outage.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: int = 10):
+        self.ratio = ratio
+        self.max_tokens = float(max_tokens)
+        self._tokens = float(max_tokens)
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def jittered_backoff(attempt: int,
+                     base: float = 0.05,
+                     cap: float = 2.0) -> float:
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class HttpStripeGateway:
+    """
+    Stripe-like adaptee that posts payments over pooled HTTP connections.
+    Every attempt for one payment carries the same `Idempotency-Key` header,
+    so the gateway must deduplicate on it for retries to be safe.
+    """
+    RETRYABLE = (ConnectionError, TimeoutError, http.client.HTTPException)
+
+    def __init__(self,
+                 pool: ConnectionPool,
+                 path: str = "/payments",
+                 retries: int = 3,
+                 budget: RetryBudget = None):
+        self.pool = pool
+        self.path = path
+        self.retries = retries
+        self.budget = budget or RetryBudget()
+
+    def make_payment(self, amount):
+        # One key per logical payment, reused on every retry, lets the
+        # gateway recognise a resent POST instead of charging twice.
+        idempotency_key = uuid.uuid4().hex
+        self.budget.record_request()
+        for attempt in range(self.retries + 1):
+            try:
+                return self._post({"amount": amount}, idempotency_key)
+            except self.RETRYABLE:
+                if attempt == self.retries or not self.budget.try_spend():
+                    raise
+            time.sleep(jittered_backoff(attempt))
+
+    def _post(self, payload, idempotency_key: str):
+        body = json.dumps(payload).encode()
+        with self.pool.connection() as connection:
+            connection.request(
+                "POST", self.path, body, {
+                    "Content-Type": "application/json",
+                    "Idempotency-Key": idempotency_key,
+                })
+            response = connection.getresponse()
+            data = response.read()
+        if response.status >= 500:
+            raise ConnectionError(f"Gateway error {response.status}")
+        if response.status >= 400:
+            raise ValueError(f"Payment rejected: {data.decode()}")
+        return json.loads(data)
+
+
+def make_adapter(target_interface, adaptee_cls, mapping: dict, name: str = None):
+    """
+    Generate an adapter class implementing `target_interface` on top of
+    `adaptee_cls`. `mapping` maps each target method to an adaptee method
+    name, or to `(name, transform)` where `transform` takes the target's
+    arguments and returns the tuple of positional arguments for the adaptee.
+    Forwarding methods are compiled once here with the target's exact
+    signature, so a call costs the same as in a hand-written adapter.
+    """
+    missing = getattr(target_interface, "__abstractmethods__",
+                      frozenset()) - mapping.keys()
+    if missing:
+        raise TypeError(f"No mapping for abstract methods: "
+                        f"{', '.join(sorted(missing))}")
+
+    namespace = {}
+    source = ["def __init__(self, adaptee):", "    self.adaptee = adaptee"]
+    for method, spec in mapping.items():
+        adaptee_method, transform = (spec, None) if isinstance(spec,
+                                                              str) else spec
+        target = getattr(target_interface, method, None)
+        if not callable(target):
+            raise TypeError(
+                f"{target_interface.__name__} has no method {method}")
+        if not callable(getattr(adaptee_cls, adaptee_method, None)):
+            raise TypeError(
+                f"{adaptee_cls.__name__} has no method {adaptee_method}")
+
+        params, call_args = [], []
+        for param in inspect.signature(target).parameters.values():
+            text = param.name
+            if param.default is not param.empty:
+                namespace[f"_{method}_{param.name}_default"] = param.default
+                text += f"=_{method}_{param.name}_default"
+            if param.kind is param.VAR_POSITIONAL:
+                text, arg = f"*{param.name}", f"*{param.name}"
+            elif param.kind is param.VAR_KEYWORD:
+                text, arg = f"**{param.name}", f"**{param.name}"
+            elif param.kind is param.KEYWORD_ONLY:
+                if not any(p.startswith("*") for p in params):
+                    params.append("*")
+                arg = f"{param.name}={param.name}"
+            else:
+                arg = param.name
+            params.append(text)
+            call_args.append(arg)
+        call = ", ".join(call_args[1:])
+        if transform is not None:
+            namespace[f"_{method}_transform"] = transform
+            call = f"*_{method}_transform({call})"
+
+        source.append(f"def {method}({', '.join(params)}):")
+        source.append(f"    return self.adaptee.{adaptee_method}({call})")
+
+    exec("\n".join(source), namespace)
+    methods = {key: namespace[key] for key in ("__init__", *mapping)}
+    name = name or f"{adaptee_cls.__name__}{target_interface.__name__}Adapter"
+    return type(name, (target_interface, ), methods)
+
+
 def process_payment(amount):
     payment_processor = StripePayment()
     stripe_adapter = StripeAdapter(payment_processor)
@@ -0,0 +1,167 @@
+"""
+-------------------------------------------------
+File: adapter_benchmark.py
+Intent:
+    Benchmarks for the payment adapters in adapter.py, kept out of the
+    pattern module so importing it stays cheap.
+
+Usage:
+    python -m patterns.structural.adapter_benchmark --output results.json
+-------------------------------------------------
+"""
+
+import sys
+import json
+import time
+import timeit
+import asyncio
+import argparse
+import threading
+import http.server
+from concurrent.futures import ThreadPoolExecutor
+
+from .adapter import (AsyncStripeAdapter, BlockingFakeStripeGateway,
+                      ConnectionPool, FakeBatchStripeGateway,
+                      FakeStripeGateway, HttpStripeGateway, PaymentProcessor,
+                      StripeAdapter, make_adapter)
+
+
+def payment_throughput_benchmark(payments: int = 200,
+                                 latency: float = 0.005) -> dict:
+    amounts = range(1, payments + 1)
+
+    sequential = StripeAdapter(BlockingFakeStripeGateway(latency))
+    start = time.perf_counter()
+    for amount in amounts:
+        sequential.pay(amount)
+    results = {"sequential": payments / (time.perf_counter() - start)}
+
+    for name, gateway in (("concurrent", FakeStripeGateway(latency)),
+                          ("batched", FakeBatchStripeGateway(latency))):
+        adapter = AsyncStripeAdapter(gateway)
+        start = time.perf_counter()
+        asyncio.run(adapter.pay_many(amounts))
+        results[name] = payments / (time.perf_counter() - start)
+    return {"payments_per_second": results}
+
+
+class _StubGatewayHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    receipts = {}
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({"receipt": f"receipt-{payload['amount']}"}).encode()
+        key = self.headers.get("Idempotency-Key")
+        if key is not None:
+            body = self.receipts.setdefault(key, body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def http_pool_benchmark(requests: int = 2000, workers: int = 8) -> dict:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+                                             _StubGatewayHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    results = {}
+    try:
+        for name, keep_alive in (("pooled", True), ("unpooled", False)):
+            pool = ConnectionPool(host, port, max_size=workers,
+                                  keep_alive=keep_alive)
+            adapter = StripeAdapter(HttpStripeGateway(pool))
+
+            def timed_pay(amount):
+                start = time.perf_counter()
+                adapter.pay(amount)
+                return time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(workers) as executor:
+                latencies = sorted(
+                    executor.map(timed_pay, range(1, requests + 1)))
+            elapsed = time.perf_counter() - start
+            pool.close()
+
+            results[name] = {
+                "requests_per_second": requests / elapsed,
+                "p50_ms": latencies[len(latencies) // 2] * 1000,
+                "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+                "connections_created": pool.metrics.created,
+                "reuse_ratio": pool.metrics.reuse_ratio,
+                "wait_seconds": pool.metrics.wait_seconds,
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+class _SilentStripePayment:
+
+    def make_payment(self, amount):
+        return amount
+
+
+class _GetattrAdapter:
+
+    def __init__(self, adaptee, mapping: dict):
+        self._adaptee = adaptee
+        self._mapping = mapping
+
+    def __getattr__(self, name):
+        return getattr(self._adaptee, self._mapping[name])
+
+
+def adapter_overhead_benchmark(calls: int = 1_000_000) -> dict:
+    GeneratedAdapter = make_adapter(PaymentProcessor, _SilentStripePayment,
+                                    {"pay": "make_payment"})
+    adaptee = _SilentStripePayment()
+    adapters = {
+        "hand_written": StripeAdapter(adaptee),
+        "generated": GeneratedAdapter(adaptee),
+        "getattr": _GetattrAdapter(adaptee, {"pay": "make_payment"}),
+    }
+    return {
+        name: timeit.timeit(lambda: adapter.pay(1), number=calls) / calls * 1e9
+        for name, adapter in adapters.items()
+    }
+
+
+BENCHMARKS = {
+    "payment_throughput": payment_throughput_benchmark,
+    "http_pool": http_pool_benchmark,
+    "adapter_overhead": adapter_overhead_benchmark,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Payment adapter benchmarks")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    parser.add_argument("--only",
+                        action="append",
+                        choices=list(BENCHMARKS),
+                        help="run only this benchmark (repeatable)")
+    args = parser.parse_args(argv)
+
+    results = {name: BENCHMARKS[name]() for name in args.only or BENCHMARKS}
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
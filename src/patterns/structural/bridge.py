@@ -15,6 +15,9 @@ Usage:
 -------------------------------------------------
 """
 
+import operator
+import threading
+from array import array
 from abc import ABC, abstractmethod
 
 
@@ -36,6 +39,15 @@ class Device(ABC):
     def is_on(self):
         pass
 
+    @abstractmethod
+    def mute(self):
+        """Set the volume to 0."""
+
+    def adjust_volume(self, delta: int):
+        step = self.volume_up if delta > 0 else self.volume_down
+        for _ in range(abs(delta)):
+            step()
+
 
 class TV(Device):
 
@@ -57,6 +69,15 @@ class TV(Device):
             self._volume -= 1
             print(f"\t +TV Volume: {self._volume}")
 
+    def adjust_volume(self, delta: int):
+        if self._is_on and delta:
+            self._volume += delta
+            print(f"\t +TV Volume: {self._volume}")
+
+    def mute(self):
+        if self._is_on:
+            self._volume = 0
+
     def is_on(self):
         return self._is_on
 
@@ -81,10 +102,128 @@ class Radio(Device):
             self._volume -= 1
             print(f"\t +Radio Volume: {self._volume}")
 
+    def adjust_volume(self, delta: int):
+        if self._is_on and delta:
+            self._volume += delta
+            print(f"\t +Radio Volume: {self._volume}")
+
+    def mute(self):
+        if self._is_on:
+            self._volume = 0
+
     def is_on(self):
         return self._is_on
 
 
+_TOGGLE = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+class DeviceFleet(Device):
+    """
+    Power and volume state of many devices in two contiguous arrays. The
+    Device methods act on the whole fleet; `select()` returns a Device view
+    over a slice or a list of indices, so any Remote can drive a selection.
+    """
+
+    def __init__(self, size: int, volume: int = 10):
+        self._on = bytearray(size)
+        self._volumes = array("i", [volume]) * size
+
+    def __len__(self):
+        return len(self._on)
+
+    def select(self, selection=slice(None)) -> "FleetSelection":
+        return FleetSelection(self, selection)
+
+    def power(self):
+        self.select().power()
+
+    def volume_up(self):
+        self.select().volume_up()
+
+    def volume_down(self):
+        self.select().volume_down()
+
+    def mute(self):
+        self.select().mute()
+
+    def adjust_volume(self, delta: int):
+        self.select().adjust_volume(delta)
+
+    def is_on(self):
+        return self.select().is_on()
+
+    def volume(self, index: int) -> int:
+        return self._volumes[index]
+
+    def device_is_on(self, index: int) -> bool:
+        return bool(self._on[index])
+
+
+class FleetSelection(Device):
+    """
+    Slice selections update the arrays with bulk slice assignments; index
+    selections fall back to one update per selected device.
+    """
+
+    def __init__(self, fleet: DeviceFleet, selection):
+        self.fleet = fleet
+        if isinstance(selection, slice):
+            self._slice, self._indices = selection, None
+        else:
+            positions = range(len(fleet))
+            self._slice = None
+            self._indices = sorted({positions[index] for index in selection})
+
+    def __len__(self):
+        if self._indices is not None:
+            return len(self._indices)
+        return len(range(*self._slice.indices(len(self.fleet))))
+
+    def power(self):
+        on = self.fleet._on
+        if self._slice is not None:
+            on[self._slice] = on[self._slice].translate(_TOGGLE)
+        else:
+            for index in self._indices:
+                on[index] ^= 1
+
+    def volume_up(self):
+        self.adjust_volume(1)
+
+    def volume_down(self):
+        self.adjust_volume(-1)
+
+    def adjust_volume(self, delta: int):
+        on, volumes = self.fleet._on, self.fleet._volumes
+        if self._slice is not None:
+            volumes[self._slice] = array(
+                "i",
+                map(operator.add, volumes[self._slice],
+                    map(delta.__mul__, on[self._slice])))
+        else:
+            for index in self._indices:
+                if on[index]:
+                    volumes[index] += delta
+
+    def mute(self):
+        on, volumes = self.fleet._on, self.fleet._volumes
+        if self._slice is not None:
+            off = on[self._slice].translate(_TOGGLE)
+            volumes[self._slice] = array(
+                "i", map(operator.mul, volumes[self._slice], off))
+        else:
+            for index in self._indices:
+                if on[index]:
+                    volumes[index] = 0
+
+    def is_on(self):
+        on = self.fleet._on
+        if self._slice is not None:
+            return 1 in on[self._slice]
+        return any(on[index] for index in self._indices)
+
+
 class Remote(ABC):
 
     def __init__(self, device: Device):
@@ -135,9 +274,101 @@ class AdvancedRemote(Remote):
     def mute(self):
         print("Advanced Remote: Muting Device")
         if self.device.is_on():
+            self.device.mute()
             print("Device muted (volume set to 0)")
 
 
+class CoalescingRemote(Remote):
+    """
+    Buffers button presses and applies their net effect at `flush()`:
+    consecutive volume presses become one `adjust_volume()` call, pairs of
+    power toggles cancel out, and a mute discards the volume change before
+    it, which `Device.mute()` would overwrite with 0 anyway. Order between
+    different operations is kept. Buffered presses are
+    flushed after `max_pending` presses, or `window` seconds after the first.
+    """
+
+    def __init__(self,
+                 device: Device,
+                 max_pending: int = 32,
+                 window: float = None):
+        super().__init__(device)
+        self.max_pending = max_pending
+        self.window = window
+        self.calls_received = 0
+        self.calls_applied = 0
+        self._pending = []
+        self._buffered = 0
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @property
+    def calls_saved(self) -> int:
+        return self.calls_received - self._buffered - self.calls_applied
+
+    def toggle_power(self):
+        self._buffer("power", 1)
+
+    def volume_up(self):
+        self._buffer("volume", 1)
+
+    def volume_down(self):
+        self._buffer("volume", -1)
+
+    def mute(self):
+        self._buffer("mute", 0)
+
+    def _buffer(self, operation: str, amount: int):
+        with self._lock:
+            self.calls_received += 1
+            self._buffered += 1
+            last = self._pending[-1] if self._pending else None
+            if last is not None and last[0] == operation:
+                last[1] += amount
+                if (operation == "power" and last[1] % 2 == 0
+                        or operation == "volume" and last[1] == 0):
+                    self._pending.pop()
+            elif operation == "mute" and last is not None and last[0] == "volume":
+                self._pending[-1] = [operation, amount]
+            else:
+                self._pending.append([operation, amount])
+
+            if self._buffered >= self.max_pending:
+                self._flush_locked()
+            elif self.window is not None and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if self._buffered:
+            print(f"Coalescing Remote: {self._buffered} presses, "
+                  f"{len(pending)} device calls")
+        self._buffered = 0
+        for operation, amount in pending:
+            if operation == "power":
+                self.device.power()
+            elif operation == "volume":
+                self.device.adjust_volume(amount)
+            else:
+                self.device.mute()
+            self.calls_applied += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
 def bridge_toggle():
     tv = TV()
     print("Created TV for Remote Controller")
@@ -11,13 +11,31 @@ Usage:
     to implement a tree-like object structure.
 -------------------------------------------------
 """
+import os
+import sys
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from contextlib import redirect_stdout
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 
 class FileSystemComponent(ABC):
 
     def __init__(self, name):
-        self.name = name
+        self._name = name
+        self.parent = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Renaming a child keeps its parent's and root's indexes in sync."""
+        if self.parent is not None:
+            self.parent._rename_child(self, name)
+        self._name = name
 
     @abstractmethod
     def display(self, indent=0):
@@ -27,6 +45,48 @@ class FileSystemComponent(ABC):
     def size(self):
         pass
 
+    def children(self):
+        return ()
+
+    def iter_preorder(self):
+        """Yield (depth, node) parents-first, using an explicit stack."""
+        stack = [iter((self, ))]
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                continue
+            yield len(stack) - 1, node
+            children = node.children()
+            if children:
+                stack.append(iter(children))
+
+    def iter_postorder(self):
+        """Yield (depth, node) children-first, using an explicit stack."""
+        stack = [(self, iter(self.children()))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                yield len(stack), node
+            else:
+                stack.append((child, iter(child.children())))
+
+    def iter_breadth_first(self):
+        """Yield (depth, node) level by level."""
+        queue = deque(((0, self), ))
+        while queue:
+            depth, node = queue.popleft()
+            yield depth, node
+            queue.extend((depth + 1, child) for child in node.children())
+
+    def _propagate_size(self, delta):
+        folder = self.parent
+        while folder is not None:
+            folder._size += delta
+            folder = folder.parent
+
 
 class File(FileSystemComponent):
 
@@ -34,32 +94,369 @@ class File(FileSystemComponent):
         super().__init__(name)
         self._file_size = file_size
 
-    def display(self, indent=0):
-        print(f"{' ' * indent}- File: {self.name} ({self._file_size} KB)")
+    def display(self, indent=0, stream=None):
+        _write_tree(self, indent, stream)
+
+    def _display_line(self, indent):
+        return f"{' ' * indent}- File: {self.name} ({self._file_size} KB)\n"
 
     def size(self):
         return self._file_size
 
+    def resize(self, file_size):
+        delta = file_size - self._file_size
+        self._file_size = file_size
+        self._propagate_size(delta)
+
 
 class Folder(FileSystemComponent):
+    """
+    Keeps the aggregate size of its subtree, updated on every change.
+    Children are indexed by name in insertion order. A top-level folder can
+    also keep an index of every path below it, built on the first `find()`.
+    """
+    SEPARATOR = "/"
 
     def __init__(self, name):
         super().__init__(name)
-        self._children = []
+        self._children = {}
+        self._size = 0
+        self._path_index = None
 
     def add(self, component: FileSystemComponent):
-        self._children.append(component)
+        folder = self
+        while folder is not None:
+            if folder is component:
+                raise ValueError(f"Cannot add {component.name} into itself")
+            folder = folder.parent
+        if self._children.get(component.name, component) is not component:
+            raise ValueError(
+                f"{self.name} already contains {component.name}")
+        if component.parent is not None:
+            component.parent.remove(component)
+        self._children[component.name] = component
+        component.parent = self
+        component._propagate_size(component.size())
+
+        if isinstance(component, Folder):
+            component._path_index = None
+        root = self._root()
+        if root._path_index is not None:
+            root._path_index.update(
+                _walk_paths(component, self._prefix() + component.name))
 
     def remove(self, component: FileSystemComponent):
-        self._children.remove(component)
+        if self._children.get(component.name) is not component:
+            raise ValueError(f"{component.name} is not in {self.name}")
+        root = self._root()
+        if root._path_index is not None:
+            prefix = self._prefix() + component.name
+            for path, _ in _walk_paths(component, prefix):
+                del root._path_index[path]
+        del self._children[component.name]
+        component._propagate_size(-component.size())
+        component.parent = None
 
-    def display(self, indent=0):
-        print(f"{' ' * indent}+ Folder: {self.name}")
-        for child in self._children:
-            child.display(indent + 2)
+    def _rename_child(self, component: FileSystemComponent, name):
+        if self._children.get(name, component) is not component:
+            raise ValueError(f"{self.name} already contains {name}")
+        root = self._root()
+        if root._path_index is not None:
+            prefix = self._prefix()
+            for path, _ in _walk_paths(component, prefix + component.name):
+                del root._path_index[path]
+            root._path_index.update(_walk_paths(component, prefix + name))
+        self._children = {
+            name if child is component else key: child
+            for key, child in self._children.items()
+        }
+
+    def get(self, name):
+        return self._children.get(name)
+
+    def resolve(self, path):
+        """Walk `path` down from this folder, one name per level."""
+        node = self
+        for name in path.split(self.SEPARATOR):
+            child = node.get(name) if isinstance(node, Folder) else None
+            if child is None:
+                raise ValueError(f"No such path: {path}")
+            node = child
+        return node
+
+    def find(self, path):
+        """Look up a path relative to the top-level folder in O(1)."""
+        root = self._root()
+        if root._path_index is None:
+            root._path_index = dict(_walk_paths(root, ""))
+            del root._path_index[""]
+        node = root._path_index.get(path)
+        if node is None:
+            raise ValueError(f"No such path: {path}")
+        return node
+
+    def _root(self):
+        folder = self
+        while folder.parent is not None:
+            folder = folder.parent
+        return folder
+
+    def _prefix(self):
+        names = []
+        folder = self
+        while folder.parent is not None:
+            names.append(folder.name)
+            folder = folder.parent
+        return "".join(name + self.SEPARATOR for name in reversed(names))
+
+    def children(self):
+        return self._children.values()
+
+    def display(self, indent=0, stream=None):
+        _write_tree(self, indent, stream)
+
+    def _display_line(self, indent):
+        return f"{' ' * indent}+ Folder: {self.name}\n"
+
+    def size(self):
+        return self._size
+
+
+DISPLAY_CHUNK_LINES = 4096
+
+
+def _write_tree(component, indent, stream):
+    """Write the tree below `component` to `stream` in chunks of lines."""
+    stream = stream or sys.stdout
+    write = stream.write
+    lines = []
+    stack = [(component, indent)]
+    while stack:
+        node, node_indent = stack.pop()
+        display_line = getattr(node, "_display_line", None)
+        if display_line is None:
+            # Components that only implement display() print their subtree.
+            write("".join(lines))
+            lines.clear()
+            with redirect_stdout(stream):
+                node.display(node_indent)
+            continue
+        lines.append(display_line(node_indent))
+        stack.extend(
+            (child, node_indent + 2) for child in reversed(node.children()))
+        if len(lines) >= DISPLAY_CHUNK_LINES:
+            write("".join(lines))
+            lines.clear()
+    if lines:
+        write("".join(lines))
+
+
+def _walk_paths(component, path):
+    """Yield (path, node) for `component`, found at `path`, and its subtree."""
+    stack = [(path, component)]
+    while stack:
+        path, node = stack.pop()
+        yield path, node
+        if isinstance(node, Folder):
+            base = path + Folder.SEPARATOR if path else ""
+            stack.extend(
+                (base + child.name, child) for child in node._children.values())
+
+
+class CompactTree:
+    """
+    Flat tree where node i is row i of parallel arrays: parent index, kind,
+    own size, child links and an offset into one UTF-8 name pool. Nodes are
+    appended after their parent, so walking rows backwards is a bottom-up
+    order and subtree sizes come from one pass over the arrays.
+    """
+    FILE = 0
+    FOLDER = 1
+
+    def __init__(self, root_name):
+        self.parents = array("i")
+        self.kinds = array("b")
+        self.sizes = array("q")
+        self.first_child = array("i")
+        self.last_child = array("i")
+        self.next_sibling = array("i")
+        self.name_offsets = array("Q", [0])
+        self.name_pool = bytearray()
+        self._totals = None
+        self._append(-1, self.FOLDER, root_name, 0)
+
+    @classmethod
+    def from_component(cls, component: FileSystemComponent) -> "CompactTree":
+        tree = cls(component.name)
+        path = [0]
+        preorder = component.iter_preorder()
+        next(preorder)
+        for depth, node in preorder:
+            del path[depth:]
+            if isinstance(node, Folder):
+                path.append(tree.add_folder(path[-1], node.name))
+            else:
+                tree.add_file(path[-1], node.name, node.size())
+        return tree
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add_folder(self, parent: int, name) -> int:
+        return self._append(parent, self.FOLDER, name, 0)
+
+    def add_file(self, parent: int, name, file_size) -> int:
+        return self._append(parent, self.FILE, name, file_size)
+
+    def _append(self, parent, kind, name, file_size):
+        index = len(self.parents)
+        if index and not 0 <= parent < index:
+            raise ValueError(f"No node {parent}")
+        if index and self.kinds[parent] != self.FOLDER:
+            raise ValueError(f"Node {parent} is not a folder")
+        self.parents.append(parent)
+        self.kinds.append(kind)
+        self.sizes.append(file_size)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        self.name_pool += name.encode()
+        self.name_offsets.append(len(self.name_pool))
+        if parent >= 0:
+            if self.last_child[parent] < 0:
+                self.first_child[parent] = index
+            else:
+                self.next_sibling[self.last_child[parent]] = index
+            self.last_child[parent] = index
+        self._totals = None
+        return index
+
+    def name(self, index: int) -> str:
+        return self.name_pool[self.name_offsets[index]:self.name_offsets[
+            index + 1]].decode()
+
+    def children(self, index: int):
+        child = self.first_child[index]
+        while child >= 0:
+            yield child
+            child = self.next_sibling[child]
+
+    def subtree_sizes(self) -> array:
+        if self._totals is None:
+            totals = array("q", self.sizes)
+            parents = self.parents
+            for index in range(len(totals) - 1, 0, -1):
+                totals[parents[index]] += totals[index]
+            self._totals = totals
+        return self._totals
+
+    def size(self, index: int = 0) -> int:
+        return self.subtree_sizes()[index]
+
+    def display(self, index: int = 0, indent: int = 0, stream=None):
+        write = (stream or sys.stdout).write
+        first_child, next_sibling = self.first_child, self.next_sibling
+        lines = []
+        stack = [(index, indent)]
+        while stack:
+            node, node_indent = stack.pop()
+            lines.append(self._display_line(node, node_indent))
+            if self.kinds[node] == self.FOLDER:
+                children = []
+                child = first_child[node]
+                while child >= 0:
+                    children.append((child, node_indent + 2))
+                    child = next_sibling[child]
+                stack.extend(reversed(children))
+            if len(lines) >= DISPLAY_CHUNK_LINES:
+                write("".join(lines))
+                lines.clear()
+        if lines:
+            write("".join(lines))
+
+    def _display_line(self, index, indent):
+        if self.kinds[index] == self.FOLDER:
+            return f"{' ' * indent}+ Folder: {self.name(index)}\n"
+        return (f"{' ' * indent}- File: {self.name(index)} "
+                f"({self.sizes[index]} KB)\n")
+
+    def node(self, index: int = 0) -> "CompactNode":
+        return CompactNode(self, index)
+
+
+class CompactNode(FileSystemComponent):
+    """File/Folder-style facade over one row of a CompactTree."""
+
+    def __init__(self, tree: CompactTree, index: int):
+        super().__init__(tree.name(index))
+        self.tree = tree
+        self.index = index
+
+    def children(self):
+        return [CompactNode(self.tree, child)
+                for child in self.tree.children(self.index)]
+
+    def display(self, indent=0, stream=None):
+        self.tree.display(self.index, indent, stream)
+
+    def _display_line(self, indent):
+        return self.tree._display_line(self.index, indent)
 
     def size(self):
-        return sum(child.size() for child in self._children)
+        return self.tree.size(self.index)
+
+
+def _scan_directory(path):
+    """
+    Return (name, path, is_dir, size_kb) for each entry, sorted by name. A
+    directory that cannot be read, or disappears mid-walk, scans as empty;
+    entries removed while scanning are skipped.
+    """
+    scanned = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                scanned.append((entry.name, entry.path, is_dir,
+                                -(-stat.st_size // 1024)))
+    except OSError:
+        return []
+    scanned.sort()
+    return scanned
+
+
+def load_folder(path, workers: int = None, max_depth: int = None) -> Folder:
+    """
+    Build a Folder tree from a directory on disk. Subdirectories are scanned
+    concurrently by `workers` threads and attached as each scan completes.
+    Every directory's entries are added in name order, so the resulting tree
+    does not depend on scheduling. Directories deeper than `max_depth` are
+    added empty. Symlinks are not followed.
+    """
+    if not os.path.isdir(path):
+        raise ValueError(f"Not a directory: {path}")
+    root = Folder(os.path.basename(os.path.abspath(path)))
+    with ThreadPoolExecutor(workers) as executor:
+        pending = {executor.submit(_scan_directory, path): (root, 0)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder, depth = pending.pop(future)
+                for name, entry_path, is_dir, size_kb in future.result():
+                    if not is_dir:
+                        folder.add(File(name, size_kb))
+                        continue
+                    child = Folder(name)
+                    folder.add(child)
+                    if max_depth is None or depth < max_depth:
+                        pending[executor.submit(_scan_directory,
+                                                entry_path)] = (child,
+                                                                depth + 1)
+    return root
 
 
 def composite_folder():
@@ -0,0 +1,74 @@
+"""
+-------------------------------------------------
+File: composite_benchmark.py
+Intent:
+    Measures how long load_folder() in composite.py takes to ingest a
+    synthetic directory tree with different numbers of scanning workers.
+
+Usage:
+    python -m patterns.structural.composite_benchmark --output results.json
+-------------------------------------------------
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+from .composite import _walk_paths, load_folder
+
+
+def _make_synthetic_tree(path, depth, fanout, files_per_folder):
+    for index in range(files_per_folder):
+        with open(os.path.join(path, f"file{index}.txt"), "wb") as file:
+            file.write(b"x" * (index * 512))
+    if depth:
+        for index in range(fanout):
+            child = os.path.join(path, f"folder{index}")
+            os.mkdir(child)
+            _make_synthetic_tree(child, depth - 1, fanout, files_per_folder)
+
+
+def ingestion_benchmark(depth: int = 4,
+                        fanout: int = 6,
+                        files_per_folder: int = 20,
+                        worker_counts=(1, 4, 16)) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as path:
+        _make_synthetic_tree(path, depth, fanout, files_per_folder)
+        reference = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            root = load_folder(path, workers=workers)
+            results[workers] = time.perf_counter() - start
+            paths = [path for path, _ in _walk_paths(root, "")]
+            if reference is None:
+                reference = paths
+            elif paths != reference:
+                raise AssertionError("Loaded tree depends on worker count")
+    return {"seconds_by_workers": results, "nodes": len(reference)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Folder ingestion benchmark")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args(argv)
+
+    results = ingestion_benchmark(args.depth, args.fanout, args.files,
+                                  args.workers)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()